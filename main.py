@@ -18,25 +18,55 @@ from datetime import datetime
 from typing import Dict, Optional
 from pathlib import Path
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+try:
+    from yaml import CSafeLoader as _YAML_LOADER
+except ImportError:
+    from yaml import SafeLoader as _YAML_LOADER
 
-from greeting_manager import GreetingManager
-from config_manager import ConfigManager
+from src.greeting_manager import GreetingManager
+from src.config_manager import ConfigManager
+
+_LOGGER = logging.getLogger('hello_world')
+
+_MENU = (
+    "\nChoose an option:\n"
+    "1. Standard greeting\n"
+    "2. Multi-language greeting\n"
+    "3. Time-based greeting\n"
+    "4. Custom message\n"
+    "5. Show greeting statistics\n"
+    "6. Show greeting history\n"
+    "7. Clear greeting history\n"
+    "8. Exit\n"
+)
+
+
+_LOGGING_CONFIGURED = False
+
+
+def _build_logging_config(config_path: str) -> Dict:
+    """Read the logging configuration dictionary from a YAML file."""
+    with open(config_path, 'rb') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
 
 
 def setup_logging(config_path: str = "config/logging.yaml") -> None:
-    """Set up logging configuration from YAML file."""
+    """
+    Set up logging configuration from YAML file.
+    
+    Only the first call configures logging; later calls are no-ops so that
+    dictConfig does not rebuild handlers and loggers again.
+    """
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+    
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        
         # Ensure log directory exists
         os.makedirs('logs', exist_ok=True)
         
-        logging.config.dictConfig(config)
-        logger = logging.getLogger('hello_world')
-        logger.info("Logging configuration loaded successfully")
+        logging.config.dictConfig(_build_logging_config(config_path))
+        _LOGGER.info("Logging configuration loaded successfully")
         
     except FileNotFoundError:
         # Fallback to basic logging if config file not found
@@ -48,24 +78,25 @@ def setup_logging(config_path: str = "config/logging.yaml") -> None:
                 logging.FileHandler('logs/hello_world.log')
             ]
         )
-        logger = logging.getLogger('hello_world')
-        logger.warning(f"Could not load logging config from {config_path}, using basic config")
+        _LOGGER.warning(f"Could not load logging config from {config_path}, using basic config")
     except Exception as e:
         print(f"Error setting up logging: {e}")
         sys.exit(1)
+    
+    _LOGGING_CONFIGURED = True
 
 
 def main():
     """Main application entry point."""
     # Set up logging
     setup_logging()
-    logger = logging.getLogger('hello_world')
+    logger = _LOGGER
     
     try:
         logger.info("Starting Hello World Advanced Application")
         
         # Load configuration
-        config_manager = ConfigManager("config/settings.yaml")
+        config_manager = ConfigManager.get_instance("config/settings.yaml")
         app_config = config_manager.get_config()
         
         logger.info(f"Loaded configuration for {app_config['app']['name']} v{app_config['app']['version']}")
@@ -77,40 +108,21 @@ def main():
         print(f"\n🌟 Welcome to {app_config['app']['name']} v{app_config['app']['version']} 🌟\n")
         
         while True:
-        print("\nChoose an option:")
-        print("1. Standard greeting")
-        print("2. Multi-language greeting") 
-        print("3. Time-based greeting")
-        print("4. Custom message")
-        print("5. Show greeting statistics")
-        print("6. Show greeting history")
-        print("7. Clear greeting history")
-        print("8. Exit")
+            sys.stdout.write(_MENU)
         
-        choice = input("\nEnter your choice (1-8): ").strip()
-        logger.debug(f"User selected option: {choice}")
+            choice = input("\nEnter your choice (1-8): ").strip()
+            logger.debug(f"User selected option: {choice}")
         
-        if choice == "1":
-            handle_standard_greeting(greeting_manager, logger)
-        elif choice == "2":
-            handle_multilang_greeting(greeting_manager, logger)
-        elif choice == "3":
-            handle_time_greeting(greeting_manager, logger)
-        elif choice == "4":
-            handle_custom_message(greeting_manager, logger)
-        elif choice == "5":
-            handle_statistics(greeting_manager, logger)
-        elif choice == "6":
-            handle_greeting_history(greeting_manager, logger)
-        elif choice == "7":
-            handle_clear_history(greeting_manager, logger)
-        elif choice == "8":
-            logger.info("Application shutting down by user request")
-            print("\nGoodbye! 👋")
-            break
-        else:
-            logger.warning(f"Invalid menu choice: {choice}")
-            print("❌ Invalid choice. Please try again.")
+            handler = _DISPATCH.get(choice)
+            if handler is None:
+                logger.warning(f"Invalid menu choice: {choice}")
+                print("❌ Invalid choice. Please try again.")
+            elif handler is _EXIT:
+                logger.info("Application shutting down by user request")
+                print("\nGoodbye! 👋")
+                break
+            else:
+                handler(greeting_manager, logger)
                 
     except KeyboardInterrupt:
         logger.info("Application interrupted by user (Ctrl+C)")
@@ -121,7 +133,7 @@ def main():
         sys.exit(1)
 
 
-def handle_standard_greeting(greeting_manager: GreetingManager, logger: logging.Logger):
+def handle_standard_greeting(greeting_manager: GreetingManager, logger: logging.Logger = _LOGGER):
     """Handle standard greeting interaction."""
     try:
         name = input("Enter your name (or press Enter for default): ").strip()
@@ -133,7 +145,7 @@ def handle_standard_greeting(greeting_manager: GreetingManager, logger: logging.
         print("❌ Error generating greeting")
 
 
-def handle_multilang_greeting(greeting_manager: GreetingManager, logger: logging.Logger):
+def handle_multilang_greeting(greeting_manager: GreetingManager, logger: logging.Logger = _LOGGER):
     """Handle multi-language greeting interaction."""
     try:
         languages = greeting_manager.get_available_languages()
@@ -153,7 +165,7 @@ def handle_multilang_greeting(greeting_manager: GreetingManager, logger: logging
         print("❌ Error generating greeting")
 
 
-def handle_time_greeting(greeting_manager: GreetingManager, logger: logging.Logger):
+def handle_time_greeting(greeting_manager: GreetingManager, logger: logging.Logger = _LOGGER):
     """Handle time-based greeting interaction."""
     try:
         name = input("Enter your name (or press Enter for default): ").strip()
@@ -165,7 +177,7 @@ def handle_time_greeting(greeting_manager: GreetingManager, logger: logging.Logg
         print("❌ Error generating greeting")
 
 
-def handle_custom_message(greeting_manager: GreetingManager, logger: logging.Logger):
+def handle_custom_message(greeting_manager: GreetingManager, logger: logging.Logger = _LOGGER):
     """Handle custom message interaction."""
     try:
         message = input("Enter your custom message: ").strip()
@@ -180,20 +192,19 @@ def handle_custom_message(greeting_manager: GreetingManager, logger: logging.Log
         print("❌ Error processing message")
 
 
-def handle_statistics(greeting_manager: GreetingManager, logger: logging.Logger):
+def handle_statistics(greeting_manager: GreetingManager, logger: logging.Logger = _LOGGER):
     """Handle statistics display."""
     try:
         stats = greeting_manager.get_statistics()
         logger.debug("Displayed greeting statistics")
-        print("\n📊 Greeting Statistics:")
-        for key, value in stats.items():
-            print(f"  {key}: {value}")
+        lines = "\n".join(f"  {key}: {value}" for key, value in stats.items())
+        print(f"\n📊 Greeting Statistics:\n{lines}")
     except Exception as e:
         logger.error(f"Error getting statistics: {str(e)}")
         print("❌ Error retrieving statistics")
 
 
-def handle_greeting_history(greeting_manager: GreetingManager, logger: logging.Logger):
+def handle_greeting_history(greeting_manager: GreetingManager, logger: logging.Logger = _LOGGER):
     """Handle greeting history display."""
     try:
         history = greeting_manager.get_greeting_history()
@@ -213,7 +224,7 @@ def handle_greeting_history(greeting_manager: GreetingManager, logger: logging.L
         print("❌ Error retrieving greeting history")
 
 
-def handle_clear_history(greeting_manager: GreetingManager, logger: logging.Logger):
+def handle_clear_history(greeting_manager: GreetingManager, logger: logging.Logger = _LOGGER):
     """Handle clearing greeting history."""
     try:
         history = greeting_manager.get_greeting_history()
@@ -234,5 +245,19 @@ def handle_clear_history(greeting_manager: GreetingManager, logger: logging.Logg
         print("❌ Error clearing greeting history")
 
 
+# Menu choice -> handler; _EXIT marks the quit option
+_EXIT = object()
+_DISPATCH = {
+    "1": handle_standard_greeting,
+    "2": handle_multilang_greeting,
+    "3": handle_time_greeting,
+    "4": handle_custom_message,
+    "5": handle_statistics,
+    "6": handle_greeting_history,
+    "7": handle_clear_history,
+    "8": _EXIT,
+}
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
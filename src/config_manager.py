@@ -4,10 +4,27 @@ Configuration Manager
 Handles loading and managing application configuration from YAML files.
 """
 
+import json
 import logging
+import struct
+import tempfile
 import yaml
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Set, Tuple
+
+try:
+    from yaml import CSafeLoader as _YAML_LOADER
+except ImportError:
+    from yaml import SafeLoader as _YAML_LOADER
+
+_MODULE_LOGGER = logging.getLogger('hello_world.config')
+
+# Parsed-config cache files start with the source file's (mtime_ns, size)
+_CACHE_HEADER = struct.Struct('<qq')
+_MISSING = object()
+
+# Shared instances handed out by ConfigManager.get_instance
+_INSTANCE_CACHE: Dict[Tuple[str, int], 'ConfigManager'] = {}
 
 
 class ConfigManager:
@@ -21,19 +38,57 @@ class ConfigManager:
             config_path: Path to the configuration YAML file
         """
         self.config_path = config_path
-        self.logger = logging.getLogger('hello_world.config')
+        self.logger = _MODULE_LOGGER
         self._config = None
+        self._get_cache: Dict[str, Any] = {}
+        self._missing_keys: Set[str] = set()
         self._load_config()
     
+    @classmethod
+    def get_instance(cls, config_path: str = "config/settings.yaml") -> 'ConfigManager':
+        """
+        Get a shared configuration manager for a file.
+        
+        Instances are cached by absolute path and modification time, so a
+        changed file yields a freshly loaded instance. Construct
+        ConfigManager directly when an independent instance is needed.
+        
+        Args:
+            config_path: Path to the configuration YAML file
+            
+        Returns:
+            Shared ConfigManager for config_path
+        """
+        abspath = os.path.abspath(config_path)
+        key = (abspath, os.stat(config_path).st_mtime_ns)
+        instance = _INSTANCE_CACHE.get(key)
+        if instance is None:
+            instance = cls(config_path)
+            # Drop instances for older versions of the same file
+            for stale in [k for k in _INSTANCE_CACHE if k[0] == abspath]:
+                del _INSTANCE_CACHE[stale]
+            _INSTANCE_CACHE[key] = instance
+        return instance
+    
     def _load_config(self) -> None:
         """Load configuration from YAML file."""
         try:
-            if not os.path.exists(self.config_path):
+            try:
+                file = open(self.config_path, 'rb')
+            except FileNotFoundError:
                 self.logger.error(f"Configuration file not found: {self.config_path}")
-                raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
+                raise FileNotFoundError(f"Configuration file not found: {self.config_path}") from None
             
-            with open(self.config_path, 'r', encoding='utf-8') as file:
-                self._config = yaml.safe_load(file)
+            with file:
+                st = os.fstat(file.fileno())
+                stamp = _CACHE_HEADER.pack(st.st_mtime_ns, st.st_size)
+                cache_path = self.config_path + '.cache'
+                
+                config = self._read_cache(cache_path, stamp)
+                if config is _MISSING:
+                    config = yaml.load(file, Loader=_YAML_LOADER)
+                    self._write_cache(cache_path, stamp, config)
+            self._config = config
             
             self.logger.info(f"Configuration loaded from {self.config_path}")
             
@@ -44,6 +99,44 @@ class ConfigManager:
             self.logger.error(f"Error loading configuration: {e}")
             raise
     
+    def _read_cache(self, cache_path: str, stamp: bytes) -> Any:
+        """Return the cached config if it matches stamp, else _MISSING."""
+        try:
+            with open(cache_path, 'rb') as file:
+                if file.read(_CACHE_HEADER.size) != stamp:
+                    return _MISSING
+                return json.loads(file.read())
+        except FileNotFoundError:
+            return _MISSING
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable config cache {cache_path}: {e}")
+            return _MISSING
+    
+    def _write_cache(self, cache_path: str, stamp: bytes, config: Any) -> None:
+        """Atomically write the parsed config next to its source file as JSON."""
+        try:
+            encoded = json.dumps(config, ensure_ascii=False)
+        except (TypeError, ValueError):
+            encoded = None
+        # Dates, non-string keys and the like do not survive a JSON round trip
+        if encoded is None or json.loads(encoded) != config:
+            self.logger.debug("Not caching config %s: not representable as JSON", cache_path)
+            return
+        payload = stamp + encoded.encode('utf-8')
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(cache_path) or '.', suffix='.tmp'
+            )
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    file.write(payload)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            self.logger.debug("Could not write config cache %s: %s", cache_path, e)
+    
     def get_config(self) -> Dict[str, Any]:
         """
         Get the full configuration dictionary.
@@ -66,6 +159,12 @@ class ConfigManager:
         Returns:
             Configuration value or default
         """
+        cached = self._get_cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cached
+        if key in self._missing_keys:
+            return default
+        
         try:
             config = self.get_config()
             keys = key.split('.')
@@ -74,17 +173,25 @@ class ConfigManager:
             for k in keys:
                 value = value[k]
             
-            self.logger.debug(f"Retrieved config value for '{key}': {value}")
+            self._get_cache[key] = value
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Retrieved config value for '%s': %s", key, value)
             return value
             
         except (KeyError, TypeError):
-            self.logger.warning(f"Configuration key '{key}' not found, using default: {default}")
+            self._missing_keys.add(key)
+            if self.logger.isEnabledFor(logging.WARNING):
+                self.logger.warning(
+                    "Configuration key %r not found, using default: %r", key, default
+                )
             return default
     
     def reload_config(self) -> None:
         """Reload configuration from file."""
         self.logger.info("Reloading configuration")
         self._config = None
+        self._get_cache.clear()
+        self._missing_keys.clear()
         self._load_config()
     
     def is_debug_enabled(self) -> bool:
@@ -5,9 +5,41 @@ Handles different types of greetings and greeting statistics.
 """
 
 import logging
+from collections import Counter, deque
 from datetime import datetime
-from typing import Dict, List, Any
-from config_manager import ConfigManager
+from itertools import islice
+from typing import Callable, Dict, List, Tuple, Any
+from .config_manager import ConfigManager
+
+_MODULE_LOGGER = logging.getLogger('hello_world.greetings')
+
+# Time-of-day buckets, in the order their templates are stored
+_TIME_KEYS = ('morning', 'afternoon', 'evening', 'night')
+
+
+def _compile_template(template: str) -> Callable[[Any], str]:
+    """
+    Turn a greeting template into a function of the name.
+    
+    Templates whose only placeholder is a single ``{name}`` become an
+    f-string around the fixed prefix and suffix; anything else falls back
+    to ``str.format``. Both convert a non-str name the same way.
+    """
+    prefix, sep, suffix = template.partition('{name}')
+    if sep and not any(c in prefix or c in suffix for c in '{}'):
+        return lambda name: f"{prefix}{name}{suffix}"
+    return lambda name: template.format(name=name)
+
+
+def _time_bucket(hour: int) -> int:
+    """Map an hour of the day (0-23) to an index into _TIME_KEYS."""
+    if 5 <= hour < 12:
+        return 0
+    elif 12 <= hour < 17:
+        return 1
+    elif 17 <= hour < 22:
+        return 2
+    return 3
 
 
 class GreetingManager:
@@ -21,23 +53,69 @@ class GreetingManager:
             config_manager: Configuration manager instance
         """
         self.config = config_manager
-        self.logger = logging.getLogger('hello_world.greetings')
+        self.logger = _MODULE_LOGGER
+        self._session_start = datetime.now()
+        self._lang_counter = Counter()
         self.stats = {
             'total_greetings': 0,
             'standard_greetings': 0,
             'multilang_greetings': 0,
             'time_based_greetings': 0,
             'custom_messages': 0,
-            'language_usage': {},
-            'session_start': datetime.now().isoformat()
+            'language_usage': self._lang_counter,
+            'session_start': self._session_start.isoformat()
         }
         
-        # New feature: Greeting history
-        self.greeting_history = []
-        self.max_history_size = 10
+        # New feature: Greeting history, newest first
+        self.greeting_history = deque(maxlen=10)
         
+        self.reload()
         self.logger.info("Greeting Manager initialized")
     
+    @property
+    def max_history_size(self) -> int:
+        """Maximum number of entries kept in greeting_history."""
+        return self.greeting_history.maxlen
+    
+    @max_history_size.setter
+    def max_history_size(self, size: int) -> None:
+        # Keep the newest entries that still fit
+        self.greeting_history = deque(islice(self.greeting_history, size), maxlen=size)
+    
+    def reload(self) -> None:
+        """
+        Re-read greeting settings from the configuration manager.
+        
+        Settings are read once and kept on the instance; call this after
+        ``config_manager.reload_config()`` to pick up changes. Time-based
+        settings are read again on the next time-based greeting.
+        """
+        self._default_name = self.config.get('greetings.default_name', 'World')
+        self._languages = self.config.get('greetings.languages', {}) or {}
+        self._lang_gen = {
+            code: _compile_template(template) for code, template in self._languages.items()
+        }
+        self._language_codes = tuple(self._languages)
+        self._languages_display = ', '.join(self._language_codes)
+        # Time-based settings are read on first use, see _load_time_settings
+        self._hour_table = None
+    
+    def _load_time_settings(self) -> None:
+        """Read the time-based greeting settings and build the hour table."""
+        self._time_enabled = self.config.get('greetings.time_based.enabled', True)
+        if not self._time_enabled:
+            self._hour_table = ()
+            return
+        templates = tuple(
+            self.config.get(f'greetings.time_based.{time_key}', 'Hello, {name}!')
+            for time_key in _TIME_KEYS
+        )
+        # (time_key, template) for every hour of the day
+        self._hour_table = tuple(
+            (_TIME_KEYS[bucket], templates[bucket])
+            for bucket in map(_time_bucket, range(24))
+        )
+    
     def get_standard_greeting(self, name: str = None) -> str:
         """
         Generate a standard greeting.
@@ -49,13 +127,14 @@ class GreetingManager:
             Formatted greeting string
         """
         if not name:
-            name = self.config.get('greetings.default_name', 'World')
+            name = self._default_name
         
         greeting = f"Hello, {name}!"
         
         self._update_stats('standard_greetings')
         self._add_to_history(greeting, 'standard', name)
-        self.logger.debug(f"Generated standard greeting for: {name}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Generated standard greeting for: %s", name)
         
         return greeting
     
@@ -74,21 +153,21 @@ class GreetingManager:
             ValueError: If language is not supported
         """
         if not name:
-            name = self.config.get('greetings.default_name', 'World')
-        
-        languages = self.config.get('greetings.languages', {})
+            name = self._default_name
         
-        if language not in languages:
-            available = ', '.join(languages.keys())
-            raise ValueError(f"Language '{language}' not supported. Available: {available}")
+        make_greeting = self._lang_gen.get(language)
+        if make_greeting is None:
+            raise ValueError(
+                f"Language '{language}' not supported. Available: {self._languages_display}"
+            )
         
-        template = languages[language]
-        greeting = template.format(name=name)
+        greeting = make_greeting(name)
         
         self._update_stats('multilang_greetings')
         self._update_language_stats(language)
         self._add_to_history(greeting, f'multilang_{language}', name)
-        self.logger.debug(f"Generated {language} greeting for: {name}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Generated %s greeting for: %s", language, name)
         
         return greeting
     
@@ -103,29 +182,20 @@ class GreetingManager:
             Time-appropriate greeting string
         """
         if not name:
-            name = self.config.get('greetings.default_name', 'World')
+            name = self._default_name
         
-        if not self.config.get('greetings.time_based.enabled', True):
+        if self._hour_table is None:
+            self._load_time_settings()
+        if not self._time_enabled:
             return self.get_standard_greeting(name)
         
-        current_hour = datetime.now().hour
-        
-        # Determine time of day
-        if 5 <= current_hour < 12:
-            time_key = 'morning'
-        elif 12 <= current_hour < 17:
-            time_key = 'afternoon'
-        elif 17 <= current_hour < 22:
-            time_key = 'evening'
-        else:
-            time_key = 'night'
-        
-        template = self.config.get(f'greetings.time_based.{time_key}', 'Hello, {name}!')
+        time_key, template = self._hour_table[datetime.now().hour]
         greeting = template.format(name=name)
         
         self._update_stats('time_based_greetings')
         self._add_to_history(greeting, f'time_based_{time_key}', name)
-        self.logger.debug(f"Generated {time_key} greeting for: {name}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Generated %s greeting for: %s", time_key, name)
         
         return greeting
     
@@ -143,19 +213,19 @@ class GreetingManager:
         
         self._update_stats('custom_messages')
         self._add_to_history(processed, 'custom_message')
-        self.logger.debug(f"Processed custom message: {message[:50]}...")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Processed custom message: %s...", message[:50])
         
         return processed
     
-    def get_available_languages(self) -> List[str]:
+    def get_available_languages(self) -> Tuple[str, ...]:
         """
-        Get list of available language codes.
+        Get available language codes.
         
         Returns:
-            List of supported language codes
+            Tuple of supported language codes
         """
-        languages = self.config.get('greetings.languages', {})
-        return list(languages.keys())
+        return self._language_codes
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -165,13 +235,13 @@ class GreetingManager:
             Dictionary containing usage statistics
         """
         # Calculate session duration
-        session_start = datetime.fromisoformat(self.stats['session_start'])
-        session_duration = datetime.now() - session_start
+        session_duration = datetime.now() - self._session_start
         
-        stats_copy = self.stats.copy()
-        stats_copy['session_duration_minutes'] = round(session_duration.total_seconds() / 60, 2)
-        
-        return stats_copy
+        return dict(
+            self.stats,
+            language_usage=dict(self._lang_counter),
+            session_duration_minutes=round(session_duration.total_seconds() / 60, 2)
+        )
     
     def _update_stats(self, greeting_type: str) -> None:
         """Update greeting statistics."""
@@ -181,9 +251,7 @@ class GreetingManager:
     
     def _update_language_stats(self, language: str) -> None:
         """Update language usage statistics."""
-        if language not in self.stats['language_usage']:
-            self.stats['language_usage'][language] = 0
-        self.stats['language_usage'][language] += 1
+        self._lang_counter[language] += 1
     
     def _add_to_history(self, greeting: str, greeting_type: str, name: str = None) -> None:
         """Add greeting to history."""
@@ -194,11 +262,8 @@ class GreetingManager:
             'timestamp': datetime.now().isoformat()
         }
         
-        self.greeting_history.insert(0, history_entry)
-        
-        # Maintain max history size
-        if len(self.greeting_history) > self.max_history_size:
-            self.greeting_history = self.greeting_history[:self.max_history_size]
+        # Newest first; the deque drops the oldest entry once full
+        self.greeting_history.appendleft(history_entry)
     
     def get_greeting_history(self) -> List[Dict[str, str]]:
         """
@@ -207,7 +272,7 @@ class GreetingManager:
         Returns:
             List of recent greetings with metadata
         """
-        return self.greeting_history.copy()
+        return list(self.greeting_history)
     
     def clear_history(self) -> None:
         """Clear the greeting history."""
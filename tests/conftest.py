@@ -0,0 +1,86 @@
+"""
+Shared pytest fixtures.
+"""
+
+import copy
+import pytest
+import yaml
+from unittest.mock import MagicMock
+from src.config_manager import ConfigManager
+
+try:
+    from yaml import CSafeDumper as YAML_DUMPER
+except ImportError:
+    from yaml import SafeDumper as YAML_DUMPER
+
+
+def dump_config(config):
+    """Serialize a config dict to YAML bytes."""
+    return yaml.dump(config, Dumper=YAML_DUMPER).encode('utf-8')
+
+
+# Greeting templates shared by the unit and integration tests
+LANG_MAP = {
+    'en': 'Hello, {name}!',
+    'es': '¡Hola, {name}!',
+    'fr': 'Bonjour, {name}!',
+    'de': 'Hallo, {name}!',
+    'it': 'Ciao, {name}!'
+}
+
+TIME_MAP = {
+    'enabled': True,
+    'morning': 'Good morning, {name}!',
+    'afternoon': 'Good afternoon, {name}!',
+    'evening': 'Good evening, {name}!',
+    'night': 'Good night, {name}!'
+}
+
+APP_TEST_CONFIG = {
+    'app': {
+        'name': 'Hello World Advanced',
+        'version': '1.0.0',
+        'debug': False
+    },
+    'greetings': {
+        'default_name': 'World',
+        'languages': LANG_MAP,
+        'time_based': TIME_MAP
+    },
+    'output': {
+        'color_enabled': True,
+        'save_to_file': True,
+        'output_file': 'logs/greetings.log'
+    }
+}
+
+# APP_TEST_CONFIG serialized once per process
+APP_TEST_CONFIG_YAML = dump_config(APP_TEST_CONFIG)
+
+
+@pytest.fixture(scope="session")
+def app_config_path(tmp_path_factory):
+    """APP_TEST_CONFIG written once per session; must not be modified."""
+    path = tmp_path_factory.mktemp("cfg") / "settings.yaml"
+    path.write_bytes(APP_TEST_CONFIG_YAML)
+    return path
+
+
+@pytest.fixture(scope="session")
+def parsed_app_config_manager(app_config_path):
+    """ConfigManager loaded once per session from app_config_path."""
+    return ConfigManager(str(app_config_path))
+
+
+@pytest.fixture
+def app_config_manager(parsed_app_config_manager):
+    """Per-test copy of the session ConfigManager, so tests stay isolated without re-parsing."""
+    return copy.deepcopy(parsed_app_config_manager)
+
+
+@pytest.fixture
+def mock_dt(monkeypatch):
+    """Replace datetime in src.greeting_manager; set mock_dt.now.return_value.hour."""
+    mock = MagicMock()
+    monkeypatch.setattr('src.greeting_manager.datetime', mock)
+    return mock
@@ -4,118 +4,177 @@ Test Configuration Manager
 Unit tests for the ConfigManager class.
 """
 
+import copy
+import json
 import pytest
-import tempfile
 import os
-import yaml
-from unittest.mock import patch, mock_open
-from src.config_manager import ConfigManager
+from pathlib import Path
+from unittest.mock import patch
+from src.config_manager import ConfigManager, _INSTANCE_CACHE
+from tests.conftest import dump_config
+
+
+TEST_CONFIG = {
+    'app': {
+        'name': 'Test App',
+        'version': '1.0.0',
+        'debug': True
+    },
+    'greetings': {
+        'default_name': 'TestWorld',
+        'languages': {
+            'en': 'Hello, {name}!',
+            'es': '¡Hola, {name}!'
+        }
+    }
+}
+
+
+# Config file contents, serialized once at import; JSON is also valid YAML
+_TEST_CONFIG_JSON = json.dumps(TEST_CONFIG).encode('utf-8')
+
+_UPDATED_CONFIG = copy.deepcopy(TEST_CONFIG)
+_UPDATED_CONFIG['app']['name'] = 'Updated App'
+_UPDATED_CONFIG_YAML = dump_config(_UPDATED_CONFIG)
+
+_CHANGED_CONFIG_YAML = dump_config({'app': {'name': 'Changed App'}})
+
+
+def write_config(path, data):
+    """Write serialized config bytes to path and return it as a string."""
+    Path(path).write_bytes(data)
+    return str(path)
+
+
+@pytest.fixture(scope="class")
+def config_path(tmp_path_factory):
+    """TEST_CONFIG as JSON, shared by every test in a class; must not be modified."""
+    return write_config(tmp_path_factory.mktemp("cfg") / "settings.yaml", _TEST_CONFIG_JSON)
+
+
+@pytest.fixture
+def config_manager(config_path):
+    """Fresh ConfigManager loaded from the shared config file."""
+    return ConfigManager(config_path)
+
+
+@pytest.fixture
+def own_config_path(tmp_path):
+    """TEST_CONFIG as JSON, private to one test, for tests that modify it."""
+    return write_config(tmp_path / "settings.yaml", _TEST_CONFIG_JSON)
 
 
 class TestConfigManager:
     """Test cases for ConfigManager."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.test_config = {
-            'app': {
-                'name': 'Test App',
-                'version': '1.0.0',
-                'debug': True
-            },
-            'greetings': {
-                'default_name': 'TestWorld',
-                'languages': {
-                    'en': 'Hello, {name}!',
-                    'es': '¡Hola, {name}!'
-                }
-            }
-        }
-    
-    def test_load_config_success(self):
+    def test_load_config_success(self, config_manager):
         """Test successful configuration loading."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(self.test_config, f)
-            temp_path = f.name
+        loaded_config = config_manager.get_config()
         
-        try:
-            config_manager = ConfigManager(temp_path)
-            loaded_config = config_manager.get_config()
-            
-            assert loaded_config == self.test_config
-            assert config_manager.get('app.name') == 'Test App'
-        finally:
-            os.unlink(temp_path)
+        assert loaded_config == TEST_CONFIG
+        assert config_manager.get('app.name') == 'Test App'
+    
+    def test_load_yaml_config(self, tmp_path):
+        """Test loading a config that uses YAML-only syntax."""
+        config_path = write_config(
+            tmp_path / "settings.yaml",
+            b"# Application settings\n"
+            b"defaults: &defaults\n"
+            b"  version: 1.0.0\n"
+            b"app:\n"
+            b"  <<: *defaults\n"
+            b"  name: Test App\n"
+            b"  debug: yes\n"
+        )
+        
+        config_manager = ConfigManager(config_path)
+        
+        assert config_manager.get('app.name') == 'Test App'
+        assert config_manager.get('app.version') == '1.0.0'
+        assert config_manager.is_debug_enabled() is True
     
     def test_load_config_file_not_found(self):
         """Test handling of missing configuration file."""
         with pytest.raises(FileNotFoundError):
             ConfigManager('nonexistent.yaml')
     
-    def test_get_nested_config_value(self):
+    def test_get_nested_config_value(self, config_manager):
         """Test retrieving nested configuration values."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(self.test_config, f)
-            temp_path = f.name
+        assert config_manager.get('app.name') == 'Test App'
+        assert config_manager.get('app.version') == '1.0.0'
+        assert config_manager.get('greetings.default_name') == 'TestWorld'
+        assert config_manager.get('nonexistent.key', 'default') == 'default'
+    
+    def test_get_memoizes_lookups(self, config_manager):
+        """Test that repeated lookups are served from the key cache."""
+        assert config_manager.get('app.name') == 'Test App'
+        assert config_manager.get('missing.key', 'first') == 'first'
         
-        try:
-            config_manager = ConfigManager(temp_path)
-            
+        with patch.object(config_manager, 'get_config') as mock_get_config:
             assert config_manager.get('app.name') == 'Test App'
-            assert config_manager.get('app.version') == '1.0.0'
-            assert config_manager.get('greetings.default_name') == 'TestWorld'
-            assert config_manager.get('nonexistent.key', 'default') == 'default'
-        finally:
-            os.unlink(temp_path)
+            assert config_manager.get('missing.key', 'second') == 'second'
+            mock_get_config.assert_not_called()
     
-    def test_is_debug_enabled(self):
-        """Test debug mode detection."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(self.test_config, f)
-            temp_path = f.name
+    def test_get_instance_shares_instances(self, own_config_path):
+        """Test that get_instance reuses instances until the file changes."""
+        first = ConfigManager.get_instance(own_config_path)
+        assert ConfigManager.get_instance(own_config_path) is first
+        assert ConfigManager(own_config_path) is not first
         
-        try:
-            config_manager = ConfigManager(temp_path)
-            assert config_manager.is_debug_enabled() is True
-        finally:
-            os.unlink(temp_path)
+        stat = os.stat(own_config_path)
+        os.utime(own_config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        second = ConfigManager.get_instance(own_config_path)
+        assert second is not first
+        assert first not in _INSTANCE_CACHE.values()
+        assert second in _INSTANCE_CACHE.values()
+    
+    def test_is_debug_enabled(self, config_manager):
+        """Test debug mode detection."""
+        assert config_manager.is_debug_enabled() is True
     
-    def test_get_app_info(self):
+    def test_get_app_info(self, config_manager):
         """Test application info retrieval."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(self.test_config, f)
-            temp_path = f.name
+        app_info = config_manager.get_app_info()
         
-        try:
-            config_manager = ConfigManager(temp_path)
-            app_info = config_manager.get_app_info()
-            
-            assert app_info['name'] == 'Test App'
-            assert app_info['version'] == '1.0.0'
-        finally:
-            os.unlink(temp_path)
+        assert app_info['name'] == 'Test App'
+        assert app_info['version'] == '1.0.0'
     
-    def test_reload_config(self):
+    def test_reload_config(self, own_config_path):
         """Test configuration reloading."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(self.test_config, f)
-            temp_path = f.name
+        config_manager = ConfigManager(own_config_path)
+        original_name = config_manager.get('app.name')
+        
+        # Modify config file
+        write_config(own_config_path, _UPDATED_CONFIG_YAML)
+        
+        config_manager.reload_config()
+        new_name = config_manager.get('app.name')
+        
+        assert original_name == 'Test App'
+        assert new_name == 'Updated App'
+    
+    def test_parsed_config_cache(self, own_config_path):
+        """Test that the parsed configuration is cached next to the YAML file."""
+        ConfigManager(own_config_path)
+        assert os.path.exists(own_config_path + '.cache')
+        
+        with patch('src.config_manager.yaml.load') as mock_load:
+            config_manager = ConfigManager(own_config_path)
+            mock_load.assert_not_called()
+        assert config_manager.get_config() == TEST_CONFIG
+        
+        # A changed source file invalidates the cache
+        write_config(own_config_path, _CHANGED_CONFIG_YAML)
+        
+        config_manager = ConfigManager(own_config_path)
+        assert config_manager.get('app.name') == 'Changed App'
+    
+    def test_config_cache_skips_non_json_values(self, tmp_path):
+        """Test that configs JSON cannot represent are parsed but not cached."""
+        config_path = write_config(tmp_path / "settings.yaml", b"app:\n  released: 2024-01-31\n  1: one\n")
+        
+        config_manager = ConfigManager(config_path)
         
-        try:
-            config_manager = ConfigManager(temp_path)
-            original_name = config_manager.get('app.name')
-            
-            # Modify config file
-            updated_config = self.test_config.copy()
-            updated_config['app']['name'] = 'Updated App'
-            
-            with open(temp_path, 'w') as f:
-                yaml.dump(updated_config, f)
-            
-            config_manager.reload_config()
-            new_name = config_manager.get('app.name')
-            
-            assert original_name == 'Test App'
-            assert new_name == 'Updated App'
-        finally:
-            os.unlink(temp_path)
\ No newline at end of file
+        assert str(config_manager.get('app.released')) == '2024-01-31'
+        assert config_manager.get_config()['app'][1] == 'one'
+        assert not os.path.exists(config_path + '.cache')
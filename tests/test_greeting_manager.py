@@ -4,231 +4,274 @@ Test Greeting Manager
 Unit tests for the GreetingManager class.
 """
 
+import importlib.util
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 from datetime import datetime
-from src.greeting_manager import GreetingManager
 from src.config_manager import ConfigManager
+from src.greeting_manager import GreetingManager, _compile_template
+from tests.conftest import LANG_MAP, TIME_MAP
 
 
-class TestGreetingManager:
-    """Test cases for GreetingManager."""
-    
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_config = Mock(spec=ConfigManager)
-        self.mock_config.get.return_value = {
-            'greetings': {
-                'default_name': 'World',
-                'languages': {
-                    'en': 'Hello, {name}!',
-                    'es': '¡Hola, {name}!',
-                    'fr': 'Bonjour, {name}!'
-                },
-                'time_based': {
-                    'enabled': True,
-                    'morning': 'Good morning, {name}!',
-                    'afternoon': 'Good afternoon, {name}!',
-                    'evening': 'Good evening, {name}!',
-                    'night': 'Good night, {name}!'
-                }
-            }
-        }
-        
-        self.greeting_manager = GreetingManager(self.mock_config)
-    
-    def test_standard_greeting_with_name(self):
-        """Test standard greeting with provided name."""
-        self.mock_config.get.return_value = 'World'
-        
-        result = self.greeting_manager.get_standard_greeting('Alice')
-        
-        assert result == 'Hello, Alice!'
-        assert self.greeting_manager.stats['standard_greetings'] == 1
-        assert self.greeting_manager.stats['total_greetings'] == 1
-    
-    def test_standard_greeting_without_name(self):
-        """Test standard greeting with default name."""
-        self.mock_config.get.return_value = 'World'
-        
-        result = self.greeting_manager.get_standard_greeting()
-        
-        assert result == 'Hello, World!'
-        assert self.greeting_manager.stats['standard_greetings'] == 1
-    
-    def test_multilang_greeting_english(self):
-        """Test multi-language greeting in English."""
-        self.mock_config.get.side_effect = lambda key, default=None: {
-            'greetings.default_name': 'World',
-            'greetings.languages': {
-                'en': 'Hello, {name}!',
-                'es': '¡Hola, {name}!',
-                'fr': 'Bonjour, {name}!'
-            }
-        }.get(key, default)
-        
-        result = self.greeting_manager.get_multilang_greeting('Bob', 'en')
-        
-        assert result == 'Hello, Bob!'
-        assert self.greeting_manager.stats['multilang_greetings'] == 1
-        assert self.greeting_manager.stats['language_usage']['en'] == 1
-    
-    def test_multilang_greeting_spanish(self):
-        """Test multi-language greeting in Spanish."""
-        self.mock_config.get.side_effect = lambda key, default=None: {
-            'greetings.default_name': 'World',
-            'greetings.languages': {
-                'en': 'Hello, {name}!',
-                'es': '¡Hola, {name}!',
-                'fr': 'Bonjour, {name}!'
-            }
-        }.get(key, default)
-        
-        result = self.greeting_manager.get_multilang_greeting('Carlos', 'es')
-        
-        assert result == '¡Hola, Carlos!'
-        assert self.greeting_manager.stats['language_usage']['es'] == 1
-    
-    def test_multilang_greeting_invalid_language(self):
-        """Test multi-language greeting with invalid language."""
-        self.mock_config.get.side_effect = lambda key, default=None: {
-            'greetings.languages': {
-                'en': 'Hello, {name}!',
-                'es': '¡Hola, {name}!'
-            }
-        }.get(key, default)
-        
-        with pytest.raises(ValueError) as exc_info:
-            self.greeting_manager.get_multilang_greeting('Alice', 'invalid')
-        
-        assert 'Language \'invalid\' not supported' in str(exc_info.value)
-    
-    @patch('src.greeting_manager.datetime')
-    def test_time_based_greeting_morning(self, mock_datetime):
-        """Test time-based greeting in the morning."""
-        mock_datetime.now.return_value.hour = 8
-        
-        self.mock_config.get.side_effect = lambda key, default=None: {
-            'greetings.default_name': 'World',
-            'greetings.time_based.enabled': True,
-            'greetings.time_based.morning': 'Good morning, {name}!'
-        }.get(key, default)
-        
-        result = self.greeting_manager.get_time_based_greeting('Alice')
-        
-        assert result == 'Good morning, Alice!'
-        assert self.greeting_manager.stats['time_based_greetings'] == 1
-    
-    @patch('src.greeting_manager.datetime')
-    def test_time_based_greeting_afternoon(self, mock_datetime):
-        """Test time-based greeting in the afternoon."""
-        mock_datetime.now.return_value.hour = 15
-        
-        self.mock_config.get.side_effect = lambda key, default=None: {
-            'greetings.default_name': 'World',
-            'greetings.time_based.enabled': True,
-            'greetings.time_based.afternoon': 'Good afternoon, {name}!'
-        }.get(key, default)
-        
-        result = self.greeting_manager.get_time_based_greeting('Bob')
-        
-        assert result == 'Good afternoon, Bob!'
-    
-    @patch('src.greeting_manager.datetime')
-    def test_time_based_greeting_evening(self, mock_datetime):
-        """Test time-based greeting in the evening."""
-        mock_datetime.now.return_value.hour = 19
-        
-        self.mock_config.get.side_effect = lambda key, default=None: {
-            'greetings.default_name': 'World',
-            'greetings.time_based.enabled': True,
-            'greetings.time_based.evening': 'Good evening, {name}!'
-        }.get(key, default)
-        
-        result = self.greeting_manager.get_time_based_greeting('Charlie')
-        
-        assert result == 'Good evening, Charlie!'
-    
-    @patch('src.greeting_manager.datetime')
-    def test_time_based_greeting_night(self, mock_datetime):
-        """Test time-based greeting at night."""
-        mock_datetime.now.return_value.hour = 23
-        
-        self.mock_config.get.side_effect = lambda key, default=None: {
-            'greetings.default_name': 'World',
-            'greetings.time_based.enabled': True,
-            'greetings.time_based.night': 'Good night, {name}!'
-        }.get(key, default)
-        
-        result = self.greeting_manager.get_time_based_greeting('Diana')
-        
-        assert result == 'Good night, Diana!'
-    
-    def test_process_custom_message(self):
-        """Test custom message processing."""
-        result = self.greeting_manager.process_custom_message('  Have a great day!  ')
-        
-        assert result == '✨ Have a great day! ✨'
-        assert self.greeting_manager.stats['custom_messages'] == 1
-    
-    def test_get_available_languages(self):
-        """Test getting available languages."""
-        self.mock_config.get.return_value = {
-            'en': 'Hello, {name}!',
-            'es': '¡Hola, {name}!',
-            'fr': 'Bonjour, {name}!'
-        }
-        
-        result = self.greeting_manager.get_available_languages()
-        
-        assert set(result) == {'en', 'es', 'fr'}
-    
-    def test_get_statistics(self):
-        """Test statistics retrieval."""
-        # Generate some greetings to populate stats
-        self.mock_config.get.return_value = 'World'
-        self.greeting_manager.get_standard_greeting('Alice')
-        self.greeting_manager.process_custom_message('Hello!')
-        
-        stats = self.greeting_manager.get_statistics()
-        
-        assert stats['total_greetings'] == 2
-        assert stats['standard_greetings'] == 1
-        assert stats['custom_messages'] == 1
-        assert 'session_duration_minutes' in stats
-        assert 'session_start' in stats
-    
-    def test_greeting_history(self):
-        """Test greeting history functionality."""
-        self.mock_config.get.return_value = 'World'
-        
-        # Initially empty history
-        history = self.greeting_manager.get_greeting_history()
-        assert len(history) == 0
-        
-        # Add a greeting
-        self.greeting_manager.get_standard_greeting('Alice')
-        history = self.greeting_manager.get_greeting_history()
-        
-        assert len(history) == 1
-        assert history[0]['greeting'] == 'Hello, Alice!'
-        assert history[0]['type'] == 'standard'
-        assert history[0]['name'] == 'Alice'
-        assert 'timestamp' in history[0]
-    
-    def test_clear_history(self):
-        """Test clearing greeting history."""
-        self.mock_config.get.return_value = 'World'
-        
-        # Add some greetings
-        self.greeting_manager.get_standard_greeting('Bob')
-        self.greeting_manager.process_custom_message('Test message')
-        
-        # Verify history has items
-        history = self.greeting_manager.get_greeting_history()
-        assert len(history) == 2
-        
-        # Clear history
-        self.greeting_manager.clear_history()
-        history = self.greeting_manager.get_greeting_history()
-        assert len(history) == 0
\ No newline at end of file
+# Configuration values as seen through ConfigManager.get's dotted keys
+_CFG = {
+    'greetings.default_name': 'World',
+    'greetings.languages': LANG_MAP,
+    **{f'greetings.time_based.{key}': value for key, value in TIME_MAP.items()}
+}
+
+
+class FakeConfig:
+    """Lightweight stand-in for ConfigManager backed by a dotted-key dict."""
+    
+    def __init__(self, data):
+        # dict.get already has ConfigManager.get's (key, default=None) signature
+        self.get = data.get
+
+
+@pytest.fixture
+def bare_config():
+    """Config with no settings; every lookup returns its default."""
+    return FakeConfig({})
+
+
+@pytest.fixture
+def full_config():
+    """Config with the languages and time-based templates in _CFG."""
+    return FakeConfig(_CFG)
+
+
+@pytest.fixture
+def greeting_manager(bare_config):
+    """GreetingManager on an empty configuration."""
+    return GreetingManager(bare_config)
+
+
+def test_standard_greeting_with_name(greeting_manager):
+    """Test standard greeting with provided name."""
+    result = greeting_manager.get_standard_greeting('Alice')
+    
+    assert result == 'Hello, Alice!'
+    assert greeting_manager.stats['standard_greetings'] == 1
+    assert greeting_manager.stats['total_greetings'] == 1
+
+
+def test_standard_greeting_without_name(greeting_manager):
+    """Test standard greeting with default name."""
+    result = greeting_manager.get_standard_greeting()
+    
+    assert result == 'Hello, World!'
+    assert greeting_manager.stats['standard_greetings'] == 1
+
+
+def test_multilang_greeting_english(full_config):
+    """Test multi-language greeting in English."""
+    greeting_manager = GreetingManager(full_config)
+    
+    result = greeting_manager.get_multilang_greeting('Bob', 'en')
+    
+    assert result == 'Hello, Bob!'
+    assert greeting_manager.stats['multilang_greetings'] == 1
+    assert greeting_manager.stats['language_usage']['en'] == 1
+
+
+def test_multilang_greeting_spanish(full_config):
+    """Test multi-language greeting in Spanish."""
+    greeting_manager = GreetingManager(full_config)
+    
+    result = greeting_manager.get_multilang_greeting('Carlos', 'es')
+    
+    assert result == '¡Hola, Carlos!'
+    assert greeting_manager.stats['language_usage']['es'] == 1
+
+
+def test_multilang_greeting_invalid_language(full_config):
+    """Test multi-language greeting with invalid language."""
+    greeting_manager = GreetingManager(full_config)
+    
+    with pytest.raises(ValueError, match=r"Language 'invalid' not supported"):
+        greeting_manager.get_multilang_greeting('Alice', 'invalid')
+
+
+@pytest.mark.parametrize('hour, expected', [
+    (8, 'Good morning, Alice!'),
+    (15, 'Good afternoon, Alice!'),
+    (19, 'Good evening, Alice!'),
+    (23, 'Good night, Alice!'),
+])
+def test_time_based_greeting(mock_dt, full_config, hour, expected):
+    """Test time-based greeting for each time of day."""
+    greeting_manager = GreetingManager(full_config)
+    
+    mock_dt.now.return_value.hour = hour
+    result = greeting_manager.get_time_based_greeting('Alice')
+    
+    assert result == expected
+    assert greeting_manager.stats['time_based_greetings'] == 1
+
+
+def test_process_custom_message(greeting_manager):
+    """Test custom message processing."""
+    result = greeting_manager.process_custom_message('  Have a great day!  ')
+    
+    assert result == '✨ Have a great day! ✨'
+    assert greeting_manager.stats['custom_messages'] == 1
+
+
+def test_get_available_languages(full_config):
+    """Test getting available languages."""
+    greeting_manager = GreetingManager(full_config)
+    
+    result = greeting_manager.get_available_languages()
+    
+    assert set(result) == set(LANG_MAP)
+
+
+def test_get_statistics(greeting_manager):
+    """Test statistics retrieval."""
+    # Generate some greetings to populate stats
+    greeting_manager.get_standard_greeting('Alice')
+    greeting_manager.process_custom_message('Hello!')
+    
+    stats = greeting_manager.get_statistics()
+    
+    assert stats['total_greetings'] == 2
+    assert stats['standard_greetings'] == 1
+    assert stats['custom_messages'] == 1
+    assert 'session_duration_minutes' in stats
+    assert 'session_start' in stats
+
+
+def test_greeting_history(greeting_manager):
+    """Test greeting history functionality."""
+    # Initially empty history
+    history = greeting_manager.get_greeting_history()
+    assert len(history) == 0
+    
+    # Add a greeting
+    greeting_manager.get_standard_greeting('Alice')
+    history = greeting_manager.get_greeting_history()
+    
+    assert len(history) == 1
+    assert history[0]['greeting'] == 'Hello, Alice!'
+    assert history[0]['type'] == 'standard'
+    assert history[0]['name'] == 'Alice'
+    assert 'timestamp' in history[0]
+
+
+def test_clear_history(greeting_manager):
+    """Test clearing greeting history."""
+    # Seed history directly; test_greeting_history covers the real recording path
+    # extendleft keeps newest first, as _add_to_history does
+    greeting_manager.greeting_history.extendleft([
+        {'greeting': 'Hello, Bob!', 'type': 'standard', 'name': 'Bob',
+         'timestamp': '2024-01-01T09:00:00'},
+        {'greeting': '✨ Test message ✨', 'type': 'custom_message', 'name': 'default',
+         'timestamp': '2024-01-01T09:00:01'}
+    ])
+    
+    # Verify history has items
+    history = greeting_manager.get_greeting_history()
+    assert len(history) == 2
+    assert history[0]['type'] == 'custom_message'
+    
+    # Clear history
+    greeting_manager.clear_history()
+    history = greeting_manager.get_greeting_history()
+    assert len(history) == 0
+
+
+def test_settings_read_once_at_construction():
+    """Test that settings are read from the config manager only when loaded."""
+    mock_config = Mock(spec=ConfigManager)
+    mock_config.get.side_effect = _CFG.get
+    
+    greeting_manager = GreetingManager(mock_config)
+    mock_config.get.assert_any_call('greetings.default_name', 'World')
+    mock_config.get.assert_any_call('greetings.languages', {})
+    mock_config.get.reset_mock()
+    
+    greeting_manager.get_standard_greeting()
+    greeting_manager.get_multilang_greeting('Bob', 'fr')
+    mock_config.get.assert_not_called()
+    
+    greeting_manager.reload()
+    mock_config.get.assert_any_call('greetings.default_name', 'World')
+
+
+def test_time_settings_read_on_first_use(mock_dt):
+    """Test that time-based settings are only looked up when first needed."""
+    mock_config = Mock(spec=ConfigManager)
+    mock_config.get.side_effect = _CFG.get
+    
+    greeting_manager = GreetingManager(mock_config)
+    looked_up = [call.args[0] for call in mock_config.get.call_args_list]
+    assert not any(key.startswith('greetings.time_based') for key in looked_up)
+    
+    mock_dt.now.return_value.hour = 9
+    assert greeting_manager.get_time_based_greeting('Alice') == 'Good morning, Alice!'
+    mock_config.get.assert_any_call('greetings.time_based.enabled', True)
+    mock_config.get.reset_mock()
+    
+    greeting_manager.get_time_based_greeting('Alice')
+    mock_config.get.assert_not_called()
+
+
+def test_history_keeps_most_recent_entries(greeting_manager):
+    """Test that history is capped at max_history_size, newest first."""
+    for i in range(greeting_manager.max_history_size + 5):
+        greeting_manager.get_standard_greeting(f'Name{i}')
+    
+    history = greeting_manager.get_greeting_history()
+    
+    assert len(history) == greeting_manager.max_history_size
+    assert history[0]['name'] == f'Name{greeting_manager.max_history_size + 4}'
+    assert history[-1]['name'] == 'Name5'
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec('pytest_benchmark') is None,
+    reason='pytest-benchmark not installed'
+)
+def test_standard_greeting_bulk_benchmark(greeting_manager, benchmark):
+    """Benchmark the per-greeting stats and history bookkeeping."""
+    benchmark(lambda: [greeting_manager.get_standard_greeting('x') for _ in range(10000)])
+    
+    assert greeting_manager.stats['standard_greetings'] >= 10000
+
+
+@pytest.mark.parametrize('template, name, expected', [
+    ('Hello, {name}!', 'Ada', 'Hello, Ada!'),
+    ('{name}', 'Ada', 'Ada'),
+    ('{name} and {name}', 'Ada', 'Ada and Ada'),
+    ('{{Hi}} {name}', 'Ada', '{Hi} Ada'),
+    ('Hello!', 'Ada', 'Hello!'),
+    ('Hello, {name}!', 2024, 'Hello, 2024!'),
+])
+def test_compile_template_matches_str_format(template, name, expected):
+    """Test that compiled templates agree with str.format."""
+    assert _compile_template(template)(name) == expected == template.format(name=name)
+
+
+def test_update_stats_ignores_unregistered_type(greeting_manager):
+    """Test that an unregistered greeting type only counts toward the total."""
+    greeting_manager._update_stats('new_mode_greetings')
+    
+    assert greeting_manager.stats['total_greetings'] == 1
+    assert 'new_mode_greetings' not in greeting_manager.stats
+
+
+def test_max_history_size_can_be_changed(greeting_manager):
+    """Test that changing max_history_size caps the history, keeping the newest entries."""
+    for i in range(6):
+        greeting_manager.get_standard_greeting(f'Name{i}')
+    
+    greeting_manager.max_history_size = 3
+    assert [entry['name'] for entry in greeting_manager.get_greeting_history()] == [
+        'Name5', 'Name4', 'Name3'
+    ]
+    
+    greeting_manager.get_standard_greeting('Name6')
+    history = greeting_manager.get_greeting_history()
+    assert len(history) == 3
+    assert history[0]['name'] == 'Name6'
@@ -4,198 +4,134 @@ Integration Tests
 End-to-end integration tests for the Hello World application.
 """
 
+import copy
 import pytest
-import tempfile
-import os
-import yaml
-from unittest.mock import patch, Mock
 from src.config_manager import ConfigManager
 from src.greeting_manager import GreetingManager
+from tests.conftest import APP_TEST_CONFIG, APP_TEST_CONFIG_YAML, dump_config
 
 
-class TestIntegration:
-    """Integration test cases."""
-    
-    def setup_method(self):
-        """Set up test fixtures with real configuration."""
-        self.test_config = {
-            'app': {
-                'name': 'Hello World Advanced',
-                'version': '1.0.0',
-                'debug': False
-            },
-            'greetings': {
-                'default_name': 'World',
-                'languages': {
-                    'en': 'Hello, {name}!',
-                    'es': '¡Hola, {name}!',
-                    'fr': 'Bonjour, {name}!',
-                    'de': 'Hallo, {name}!',
-                    'it': 'Ciao, {name}!'
-                },
-                'time_based': {
-                    'enabled': True,
-                    'morning': 'Good morning, {name}!',
-                    'afternoon': 'Good afternoon, {name}!',
-                    'evening': 'Good evening, {name}!',
-                    'night': 'Good night, {name}!'
-                }
-            },
-            'output': {
-                'color_enabled': True,
-                'save_to_file': True,
-                'output_file': 'logs/greetings.log'
-            }
-        }
-    
-    def test_full_workflow_standard_greeting(self):
-        """Test complete workflow for standard greeting."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(self.test_config, f)
-            temp_path = f.name
-        
-        try:
-            # Initialize managers
-            config_manager = ConfigManager(temp_path)
-            greeting_manager = GreetingManager(config_manager)
-            
-            # Test standard greeting
-            result = greeting_manager.get_standard_greeting('Integration Test')
-            
-            assert result == 'Hello, Integration Test!'
-            
-            # Check statistics
-            stats = greeting_manager.get_statistics()
-            assert stats['total_greetings'] == 1
-            assert stats['standard_greetings'] == 1
-            
-        finally:
-            os.unlink(temp_path)
-    
-    def test_full_workflow_multilang_greetings(self):
-        """Test complete workflow for multiple language greetings."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(self.test_config, f)
-            temp_path = f.name
-        
-        try:
-            config_manager = ConfigManager(temp_path)
-            greeting_manager = GreetingManager(config_manager)
-            
-            # Test multiple languages
-            languages = ['en', 'es', 'fr', 'de', 'it']
-            expected_greetings = [
-                'Hello, MultiLang!',
-                '¡Hola, MultiLang!',
-                'Bonjour, MultiLang!',
-                'Hallo, MultiLang!',
-                'Ciao, MultiLang!'
-            ]
-            
-            results = []
-            for lang in languages:
-                result = greeting_manager.get_multilang_greeting('MultiLang', lang)
-                results.append(result)
-            
-            assert results == expected_greetings
-            
-            # Check statistics
-            stats = greeting_manager.get_statistics()
-            assert stats['total_greetings'] == 5
-            assert stats['multilang_greetings'] == 5
-            
-            # Check language usage
-            for lang in languages:
-                assert stats['language_usage'][lang] == 1
-                
-        finally:
-            os.unlink(temp_path)
-    
-    @patch('src.greeting_manager.datetime')
-    def test_full_workflow_time_based_greetings(self, mock_datetime):
-        """Test complete workflow for time-based greetings throughout the day."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(self.test_config, f)
-            temp_path = f.name
-        
-        try:
-            config_manager = ConfigManager(temp_path)
-            greeting_manager = GreetingManager(config_manager)
-            
-            # Test different times of day
-            test_cases = [
-                (8, 'Good morning, TimeTest!'),
-                (14, 'Good afternoon, TimeTest!'),
-                (19, 'Good evening, TimeTest!'),
-                (2, 'Good night, TimeTest!')
-            ]
-            
-            for hour, expected in test_cases:
-                mock_datetime.now.return_value.hour = hour
-                result = greeting_manager.get_time_based_greeting('TimeTest')
-                assert result == expected
-            
-            # Check statistics
-            stats = greeting_manager.get_statistics()
-            assert stats['total_greetings'] == 4
-            assert stats['time_based_greetings'] == 4
-            
-        finally:
-            os.unlink(temp_path)
-    
-    def test_configuration_reload_affects_greetings(self):
-        """Test that configuration changes affect greeting behavior."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(self.test_config, f)
-            temp_path = f.name
-        
-        try:
-            config_manager = ConfigManager(temp_path)
-            greeting_manager = GreetingManager(config_manager)
-            
-            # Initial greeting
-            result1 = greeting_manager.get_standard_greeting()
-            assert result1 == 'Hello, World!'
-            
-            # Modify configuration
-            modified_config = self.test_config.copy()
-            modified_config['greetings']['default_name'] = 'Universe'
-            
-            with open(temp_path, 'w') as f:
-                yaml.dump(modified_config, f)
-            
-            # Reload configuration
-            config_manager.reload_config()
-            
-            # Create new greeting manager with updated config
-            greeting_manager_new = GreetingManager(config_manager)
-            result2 = greeting_manager_new.get_standard_greeting()
-            
-            assert result2 == 'Hello, Universe!'
-            
-        finally:
-            os.unlink(temp_path)
-    
-    def test_error_handling_invalid_language(self):
-        """Test error handling for invalid language codes."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(self.test_config, f)
-            temp_path = f.name
-        
-        try:
-            config_manager = ConfigManager(temp_path)
-            greeting_manager = GreetingManager(config_manager)
-            
-            # Test invalid language
-            with pytest.raises(ValueError) as exc_info:
-                greeting_manager.get_multilang_greeting('Test', 'invalid')
-            
-            assert 'not supported' in str(exc_info.value)
-            
-            # Statistics should not be affected by failed operations
-            stats = greeting_manager.get_statistics()
-            assert stats['total_greetings'] == 0
-            assert stats['multilang_greetings'] == 0
-            
-        finally:
-            os.unlink(temp_path)
\ No newline at end of file
+# APP_TEST_CONFIG with a different default name, serialized once at import
+_MODIFIED_CONFIG = copy.deepcopy(APP_TEST_CONFIG)
+_MODIFIED_CONFIG['greetings']['default_name'] = 'Universe'
+_MODIFIED_CONFIG_YAML = dump_config(_MODIFIED_CONFIG)
+
+_LANGS = ('en', 'es', 'fr', 'de', 'it')
+_EXPECTED_MULTILANG = (
+    'Hello, MultiLang!',
+    '¡Hola, MultiLang!',
+    'Bonjour, MultiLang!',
+    'Hallo, MultiLang!',
+    'Ciao, MultiLang!'
+)
+
+
+@pytest.fixture
+def own_app_config_path(tmp_path):
+    """APP_TEST_CONFIG written for a single test, for tests that modify it."""
+    path = tmp_path / "settings.yaml"
+    path.write_bytes(APP_TEST_CONFIG_YAML)
+    return path
+
+
+def test_full_workflow_standard_greeting(app_config_manager):
+    """Test complete workflow for standard greeting."""
+    # Initialize greeting manager on the shared configuration
+    greeting_manager = GreetingManager(app_config_manager)
+    
+    # Test standard greeting
+    result = greeting_manager.get_standard_greeting('Integration Test')
+    
+    assert result == 'Hello, Integration Test!'
+    
+    # Check statistics
+    stats = greeting_manager.get_statistics()
+    assert stats['total_greetings'] == 1
+    assert stats['standard_greetings'] == 1
+
+
+@pytest.mark.parametrize('lang, expected', list(zip(_LANGS, _EXPECTED_MULTILANG)))
+def test_full_workflow_multilang_greeting(app_config_manager, lang, expected):
+    """Test complete workflow for a greeting in each configured language."""
+    greeting_manager = GreetingManager(app_config_manager)
+    
+    result = greeting_manager.get_multilang_greeting('MultiLang', lang)
+    
+    assert result == expected
+
+
+def test_full_workflow_multilang_statistics(app_config_manager):
+    """Test that statistics accumulate across languages on one manager."""
+    greeting_manager = GreetingManager(app_config_manager)
+    
+    results = [greeting_manager.get_multilang_greeting('MultiLang', lang) for lang in _LANGS]
+    assert tuple(results) == _EXPECTED_MULTILANG
+    
+    # Check statistics
+    stats = greeting_manager.get_statistics()
+    assert stats['total_greetings'] == 5
+    assert stats['multilang_greetings'] == 5
+    
+    # Check language usage
+    for lang in _LANGS:
+        assert stats['language_usage'][lang] == 1
+
+
+@pytest.mark.parametrize('hour, expected', [
+    (8, 'Good morning, TimeTest!'),
+    (14, 'Good afternoon, TimeTest!'),
+    (19, 'Good evening, TimeTest!'),
+    (2, 'Good night, TimeTest!')
+])
+def test_full_workflow_time_based_greetings(mock_dt, app_config_manager, hour, expected):
+    """Test complete workflow for time-based greetings throughout the day."""
+    greeting_manager = GreetingManager(app_config_manager)
+    
+    mock_dt.now.return_value.hour = hour
+    result = greeting_manager.get_time_based_greeting('TimeTest')
+    assert result == expected
+    
+    # Check statistics
+    stats = greeting_manager.get_statistics()
+    assert stats['total_greetings'] == 1
+    assert stats['time_based_greetings'] == 1
+
+
+def test_configuration_reload_affects_greetings(own_app_config_path):
+    """Test that configuration changes affect greeting behavior."""
+    config_manager = ConfigManager(str(own_app_config_path))
+    greeting_manager = GreetingManager(config_manager)
+    
+    # Initial greeting
+    result1 = greeting_manager.get_standard_greeting()
+    assert result1 == 'Hello, World!'
+    
+    # Modify configuration
+    own_app_config_path.write_bytes(_MODIFIED_CONFIG_YAML)
+    
+    # Reload configuration
+    config_manager.reload_config()
+    
+    # Create new greeting manager with updated config
+    greeting_manager_new = GreetingManager(config_manager)
+    result2 = greeting_manager_new.get_standard_greeting()
+    
+    assert result2 == 'Hello, Universe!'
+    
+    # Existing greeting manager picks up the change on reload
+    greeting_manager.reload()
+    assert greeting_manager.get_standard_greeting() == 'Hello, Universe!'
+
+
+def test_error_handling_invalid_language(app_config_manager):
+    """Test error handling for invalid language codes."""
+    greeting_manager = GreetingManager(app_config_manager)
+    
+    # Test invalid language
+    with pytest.raises(ValueError, match=r"not supported"):
+        greeting_manager.get_multilang_greeting('Test', 'invalid')
+    
+    # Statistics should not be affected by failed operations
+    stats = greeting_manager.get_statistics()
+    assert stats['total_greetings'] == 0
+    assert stats['multilang_greetings'] == 0